@@ -13,7 +13,7 @@ from ollama import AsyncClient
 
 from cmop_observer.agent import CMOPObserverAgent
 from cmop_observer.api.client import CMOPClient
-from cmop_observer.config import Settings
+from cmop_observer.config import get_settings
 from cmop_observer.prompts import SYSTEM_PROMPT
 from cmop_observer.tools import register_basic_tools, register_medical_tools
 from latacc_common.tools import ToolRegistry
@@ -28,7 +28,7 @@ logger = logging.getLogger(__name__)
 
 async def run() -> None:
     """Bootstrap and run the CMOP Observer Agent."""
-    settings = Settings()
+    settings = get_settings()
 
     # Initialise OTel tracing (exports to Jaeger via OTLP/gRPC)
     init_tracing(
@@ -65,11 +65,13 @@ async def run() -> None:
         # Initialise session with unified prompt
         agent.init_session(SYSTEM_PROMPT)
 
-        # Load schema for dynamic awareness
-        await agent.load_schema()
+        # Load schema in the background — the fetch is an independent
+        # HTTP round-trip that can overlap with the remaining setup
+        schema_task = asyncio.create_task(agent.load_schema())
 
         # Initial observation (stays in message history)
         print("\n🔍 Starting CMOP observation...\n")
+        await schema_task
         analysis = await agent.observe(
             "Analyze the current CMOP state. "
             "What is the medical situation? "
@@ -88,7 +90,14 @@ async def run() -> None:
 
 def main() -> None:
     """Sync entry point."""
-    asyncio.run(run())
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is unavailable on Windows — default loop is fine
+        asyncio.run(run())
+    else:
+        uvloop.install()
+        asyncio.run(run())
 
 
 if __name__ == "__main__":
@@ -7,10 +7,15 @@ and interactive modes, so context from the initial analysis is
 available during Q&A.
 """
 
-import json
+import asyncio
 import logging
+import uuid
+from collections import deque
 from typing import Any
 
+import aioconsole
+import orjson
+
 from ollama import AsyncClient
 
 from cmop_observer.api.client import CMOPClient
@@ -20,6 +25,22 @@ from latacc_common.tools import ToolRegistry
 logger = logging.getLogger(__name__)
 
 
+class _LazyJson:
+    """Defer JSON encoding of log arguments until the record is emitted.
+
+    Costs nothing when the log level is disabled or the handler drops
+    the record before formatting.
+    """
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self._obj = obj
+
+    def __str__(self) -> str:
+        return orjson.dumps(self._obj, default=str).decode()
+
+
 class CMOPObserverAgent:
     """
     MEDEVAC observer agent with tool calling capabilities.
@@ -39,13 +60,32 @@ class CMOPObserverAgent:
         self._llm = llm
         self._tools = tools
         self._settings = settings
-        self._messages: list[dict[str, Any]] = []
+        # System prompt is held apart from the rolling history: the
+        # bounded deque drops the oldest turns in long interactive
+        # sessions while the prompt itself is never evicted.
+        self._system_msg: dict[str, Any] | None = None
+        self._history: deque[dict[str, Any]] = deque(
+            maxlen=settings.max_iterations * 4
+        )
         self._schema_cache: dict = {}
+        # Prefetched CMOP state injected into the first observation
+        self._preload: dict | None = None
+        # Full tool results for payloads truncated in the history
+        self._tool_cache: dict[str, str] = {}
+        # Per-call ollama options, finalised in init_session()
+        self._chat_options: dict[str, Any] = {}
 
         # Register the `done` signal tool
         self._done_result: str | None = None
         self._register_done_tool()
 
+        # Snapshot schemas once — the registry is fully populated by now
+        # and recomputing the list on every LLM call is wasted work
+        self._tool_schemas = self._tools.schemas
+        # Pre-bound dispatch table: one dict lookup per call, no
+        # per-invocation registry lookup
+        self._dispatch = self._tools.build_dispatch()
+
     def _register_done_tool(self) -> None:
         """Register a 'done' tool the agent calls to signal completion."""
 
@@ -61,19 +101,49 @@ class CMOPObserverAgent:
 
     def init_session(self, system_prompt: str) -> None:
         """Initialise the message history with the system prompt."""
-        self._messages = [{"role": "system", "content": system_prompt}]
+        self._system_msg = {"role": "system", "content": system_prompt}
+        self._history.clear()
+
+        # Pin the system prompt in ollama's KV cache (num_keep) so it is
+        # not re-prefilled on every turn. Token count is estimated at
+        # ~4 chars/token — no tokenizer dependency needed for a bound.
+        self._chat_options: dict[str, Any] = {
+            "num_keep": max(1, len(system_prompt) // 4),
+            "num_ctx": self._settings.ollama_num_ctx,
+            "num_batch": self._settings.ollama_num_batch,
+        }
 
     async def load_schema(self) -> None:
-        """Load CMOP schema at startup for dynamic category awareness."""
+        """
+        Load CMOP schema at startup for dynamic category awareness.
+
+        Entities and casualties are prefetched concurrently alongside
+        the schema — the first observation always queries them, so
+        handing them to the model as a preloaded tool result saves
+        two to three tool iterations.
+        """
         logger.info("Loading CMOP schema...")
-        result = await self._client.get_schema()
+        schema, entities, casualties = await asyncio.gather(
+            self._client.get_schema(),
+            self._client.get_entities(),
+            self._client.get_casualties(),
+        )
 
-        if result.success and result.data:
-            self._schema_cache = result.data
-            categories = result.data.get("categories", [])
+        if schema.success and schema.data:
+            self._schema_cache = schema.data
+            categories = schema.data.get("categories", [])
             logger.info("Schema loaded: %d categories available", len(categories))
         else:
-            logger.warning("Schema load failed: %s", result.message)
+            logger.warning("Schema load failed: %s", schema.message)
+
+        preload: dict[str, Any] = {}
+        if schema.success and schema.data:
+            preload["schema"] = schema.data
+        if entities.success:
+            preload["entities"] = entities.data
+        if casualties.success:
+            preload["casualties"] = casualties.data
+        self._preload = preload or None
 
     async def _run_tool_loop(self) -> str:
         """
@@ -85,54 +155,162 @@ class CMOPObserverAgent:
         """
         self._done_result = None
 
+        # Memoize tool calls for the duration of this run: the LLM may
+        # re-issue an identical call while it thrashes, and each repeat
+        # costs an API round-trip plus a full prefill
+        seen: dict[tuple[str, bytes], asyncio.Task] = {}
+
         for iteration in range(1, self._settings.max_iterations + 1):
             logger.debug("Iteration %d/%d", iteration, self._settings.max_iterations)
 
-            # Think — LLM call
-            response = await self._llm.chat(
+            # Think — stream the LLM response. Ollama delivers each tool
+            # call as a complete object in its chunk, so we can dispatch
+            # it immediately and overlap CMOP API round-trips with the
+            # remaining LLM decode. `done` is deferred (task None) so its
+            # summary reflects all other results.
+            content_parts: list[str] = []
+            calls: list[tuple[str, Any]] = []
+            tasks: list[asyncio.Task | None] = []
+
+            stream = await self._llm.chat(
                 model=self._settings.model,
-                messages=self._messages,
-                tools=self._tools.schemas,
+                messages=self._build_messages(),
+                tools=self._tool_schemas,
+                options=self._chat_options,
+                keep_alive=self._settings.ollama_keep_alive,
+                stream=True,
             )
-
-            message = response["message"]
-            self._messages.append(message)
+            async for chunk in stream:
+                part = chunk["message"]
+                if part.get("content"):
+                    content_parts.append(part["content"])
+                for tool_call in part.get("tool_calls") or []:
+                    name = tool_call["function"]["name"]
+                    args = tool_call["function"]["arguments"]
+                    logger.info("Tool call: %s(%s)", name, _LazyJson(args))
+                    calls.append((name, args))
+                    if name == "done":
+                        tasks.append(None)
+                        continue
+                    key = (name, orjson.dumps(args, option=orjson.OPT_SORT_KEYS))
+                    task = seen.get(key)
+                    if task is None:
+                        task = asyncio.create_task(self._execute(name, args))
+                        seen[key] = task
+                    else:
+                        logger.warning(
+                            "Duplicate tool call served from memo: %s", name
+                        )
+                    tasks.append(task)
+
+            content = "".join(content_parts)
+            message: dict[str, Any] = {"role": "assistant", "content": content}
+            if calls:
+                message["tool_calls"] = [
+                    {"function": {"name": n, "arguments": a}} for n, a in calls
+                ]
+            self._history.append(message)
 
             # No tool calls → agent finished (implicit done)
-            if not message.get("tool_calls"):
-                return message.get("content", "")
-
-            # Act — execute each tool call
-            for tool_call in message["tool_calls"]:
-                name = tool_call["function"]["name"]
-                args = tool_call["function"]["arguments"]
-
-                logger.info(
-                    "Tool call: %s(%s)",
-                    name,
-                    json.dumps(args, ensure_ascii=False),
+            if not calls:
+                return content
+
+            # Reflect — collect results in call order
+            for (name, args), task in zip(calls, tasks):
+                result = (
+                    await task
+                    if task is not None
+                    else await self._execute(name, args)
                 )
-
-                result = await self._tools.execute(name, args)
-
-                # Reflect — add result to history
-                self._messages.append({
+                content_json = await self._encode_result(result)
+                self._history.append({
                     "role": "tool",
-                    "content": json.dumps(
-                        result, ensure_ascii=False, default=str
-                    ),
+                    "content": self._compact_tool_content(content_json),
                 })
+            self._compact_history()
 
-                # Check explicit done signal
-                if self._done_result is not None:
-                    logger.info("Agent signalled done at iteration %d", iteration)
-                    return self._done_result
+            # Check explicit done signal
+            if self._done_result is not None:
+                logger.info("Agent signalled done at iteration %d", iteration)
+                return self._done_result
 
         logger.warning(
             "Agent exceeded max iterations (%d)", self._settings.max_iterations
         )
         return "⚠️ Analysis incomplete — agent exceeded iteration limit."
 
+    async def _encode_result(self, result: Any) -> str:
+        """
+        Encode a tool result to JSON, off the event loop when large.
+
+        Serializing a big entity array inline blocks concurrent HTTP
+        completions; small results stay inline to avoid the thread-hop
+        overhead.
+        """
+        data = result.get("data") if isinstance(result, dict) else None
+        if isinstance(data, (list, dict)) and len(data) > 100:
+            encoded = await asyncio.to_thread(orjson.dumps, result, default=str)
+            return encoded.decode()
+        return orjson.dumps(result, default=str).decode()
+
+    def _build_messages(self) -> list[dict[str, Any]]:
+        """Assemble the chat message list from system prompt + history."""
+        if self._system_msg is None:
+            return list(self._history)
+        return [self._system_msg, *self._history]
+
+    def _execute(self, name: str, args: dict[str, Any]) -> Any:
+        """Dispatch a tool call via the pre-bound table.
+
+        Unknown names (LLM hallucinations) fall back to the registry's
+        checked execute() path.
+        """
+        handler = self._dispatch.get(name)
+        if handler is None:
+            return self._tools.execute(name, args)
+        return handler(args)
+
+    def _compact_tool_content(self, content: str) -> str:
+        """
+        Truncate an oversized tool result for the message history.
+
+        Every later LLM call re-prefills the full history, so huge
+        entity arrays make iteration cost grow quadratically. Results
+        over the budget are replaced with a truncated summary; the full
+        payload stays in ``self._tool_cache`` under a cache id.
+        """
+        budget = self._settings.tool_result_budget
+        if len(content) <= budget:
+            return content
+
+        cache_id = uuid.uuid4().hex[:12]
+        self._tool_cache[cache_id] = content
+        return orjson.dumps({
+            "summary": content[:budget],
+            "elided": True,
+            "cache_id": cache_id,
+        }).decode()
+
+    def _compact_history(self) -> None:
+        """
+        Collapse tool messages older than the history window.
+
+        Older tool results rarely matter once the agent has reasoned
+        over them; their content is replaced with a placeholder (one per
+        message, so tool_call alignment is preserved).
+        """
+        window = self._settings.tool_history_window
+        tool_indices = [
+            i for i, m in enumerate(self._history) if m.get("role") == "tool"
+        ]
+        if len(tool_indices) <= window:
+            return
+        for i in tool_indices[:-window]:
+            self._history[i] = {
+                "role": "tool",
+                "content": "[earlier tool result omitted]",
+            }
+
     async def observe(self, task: str) -> str:
         """
         Run an observation task (e.g. initial CMOP analysis).
@@ -146,7 +324,19 @@ class CMOPObserverAgent:
         Returns:
             The agent's analysis text.
         """
-        self._messages.append({"role": "user", "content": task})
+        self._history.append({"role": "user", "content": task})
+
+        # Inject prefetched CMOP state as a synthetic tool result so the
+        # model starts from ground truth without issuing the calls itself
+        if self._preload is not None:
+            self._history.append({
+                "role": "tool",
+                "content": orjson.dumps(
+                    {"preloaded_cmop_state": self._preload}, default=str
+                ).decode(),
+            })
+            self._preload = None
+
         result = await self._run_tool_loop()
         # The result is already in messages via the assistant message
         return result
@@ -166,7 +356,9 @@ class CMOPObserverAgent:
 
         while True:
             try:
-                user_input = input("👨🏻‍⚕️ You: ").strip()
+                # ainput keeps the event loop free while waiting, so
+                # background tasks (prefetches, cache refresh) keep running
+                user_input = (await aioconsole.ainput("👨🏻‍⚕️ You: ")).strip()
             except (EOFError, KeyboardInterrupt):
                 print("\n👋 Exiting.")
                 break
@@ -178,7 +370,7 @@ class CMOPObserverAgent:
             if not user_input:
                 continue
 
-            self._messages.append({"role": "user", "content": user_input})
+            self._history.append({"role": "user", "content": user_input})
 
             response = await self._run_tool_loop()
             print(f"\n🤖 Agent: {response}\n")
\ No newline at end of file
@@ -7,9 +7,11 @@ All methods return ApiResponse with structured error signals.
 """
 
 import logging
+import time
 from typing import Any
 
 import httpx
+import msgspec
 
 from cmop_observer.config import Settings
 from latacc_common.models import ApiResponse, ErrorAction
@@ -17,6 +19,19 @@ from latacc_common.models import ApiResponse, ErrorAction
 logger = logging.getLogger(__name__)
 
 
+class _Envelope(msgspec.Struct):
+    """Typed view of the CMOP API response envelope (``{"data": ...}``)."""
+
+    data: Any = msgspec.UNSET
+
+
+# Module-level decoders — built once, reused for every response.
+# Decoding into the Struct skips the intermediate dict for the
+# enveloped (common) case; the raw decoder covers bare payloads.
+_ENVELOPE_DECODER = msgspec.json.Decoder(_Envelope)
+_RAW_DECODER = msgspec.json.Decoder()
+
+
 class CMOPClient:
     """
     Async client for the CMOP Map REST API.
@@ -30,13 +45,23 @@ class CMOPClient:
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._http: httpx.AsyncClient | None = None
+        # (path, params) → (expiry, response) for short-lived GET caching
+        self._cache: dict[tuple, tuple[float, ApiResponse]] = {}
 
     # -- Lifecycle (async context manager) ----------------------------------
 
     async def __aenter__(self) -> "CMOPClient":
+        # HTTP/2 multiplexes concurrent GETs over one connection
+        # (negotiated via ALPN — falls back to HTTP/1.1 if the CMOP
+        # API does not support h2). Pool limits sized for tool fan-out.
         self._http = httpx.AsyncClient(
             base_url=self._settings.api_base,
             timeout=self._settings.request_timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+            ),
         )
         return self
 
@@ -47,6 +72,33 @@ class CMOPClient:
 
     # -- Internal helpers ---------------------------------------------------
 
+    async def _cached_get(
+        self,
+        path: str,
+        params: dict | None = None,
+        ttl: float = 0,
+    ) -> ApiResponse:
+        """
+        GET with a short-lived in-process cache.
+
+        Repeat calls within ``ttl`` seconds skip the HTTP round-trip
+        entirely. ``ttl=0`` (default) bypasses the cache. Only
+        successful responses are cached.
+        """
+        if ttl <= 0:
+            return await self._get(path, params)
+
+        key = (path, frozenset((params or {}).items()))
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+
+        resp = await self._get(path, params)
+        if resp.success:
+            self._cache[key] = (now + ttl, resp)
+        return resp
+
     async def _get(self, path: str, params: dict | None = None) -> ApiResponse:
         """
         Execute GET request with structured error handling.
@@ -86,8 +138,15 @@ class CMOPClient:
                 )
 
             try:
-                data = resp.json()
-                return ApiResponse(success=True, data=data.get("data", data))
+                try:
+                    envelope = _ENVELOPE_DECODER.decode(resp.content)
+                    data = envelope.data
+                    if data is msgspec.UNSET:
+                        data = _RAW_DECODER.decode(resp.content)
+                except msgspec.ValidationError:
+                    # Top-level payload is not an object (e.g. bare list)
+                    data = _RAW_DECODER.decode(resp.content)
+                return ApiResponse(success=True, data=data)
             except Exception as exc:
                 return ApiResponse(
                     success=False,
@@ -137,7 +196,7 @@ class CMOPClient:
 
     async def get_entities_by_category(self, category: str) -> ApiResponse[list[dict]]:
         """GET /api/entities/categoria/:c — filter by category."""
-        return await self._get(f"/api/entities/categoria/{category}")
+        return await self._cached_get(f"/api/entities/categoria/{category}", ttl=2)
 
     async def get_nearby_entities(
         self,
@@ -159,11 +218,11 @@ class CMOPClient:
 
     async def get_casualties_by_triage(self, color: str) -> ApiResponse[list[dict]]:
         """GET /api/medical/triage/:color — filter by triage color."""
-        return await self._get(f"/api/medical/triage/{color}")
+        return await self._cached_get(f"/api/medical/triage/{color}", ttl=2)
 
     async def get_casualties_by_evac_stage(self, stage: str) -> ApiResponse[list[dict]]:
         """GET /api/medical/evac-stage/:stage — filter by evac stage."""
-        return await self._get(f"/api/medical/evac-stage/{stage}")
+        return await self._cached_get(f"/api/medical/evac-stage/{stage}", ttl=2)
 
     async def get_nine_line(self, entity_id: int) -> ApiResponse[dict]:
         """GET /api/medical/:entity_id/nine-line — 9-Line MEDEVAC data."""
@@ -172,8 +231,8 @@ class CMOPClient:
     # -- Schema / Scenarios -------------------------------------------------
 
     async def get_schema(self) -> ApiResponse[dict]:
-        """GET /api/schema — categories, enums, subtypes."""
-        return await self._get("/api/schema")
+        """GET /api/schema — categories, enums, subtypes (cached 5 min)."""
+        return await self._cached_get("/api/schema", ttl=300)
 
     async def get_scenarios(self) -> ApiResponse[list[dict]]:
         """GET /api/scenarios — available scenarios."""
@@ -1,5 +1,7 @@
 """Observer agent configuration via environment variables."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -11,6 +13,9 @@ class Settings(BaseSettings):
     with the ``CMOP_`` prefix. Example::
 
         CMOP_MODEL=llama3:70b CMOP_API_BASE=http://10.0.0.5:3000 cmop-observer
+
+    For concurrent tool dispatch to pay off on the LLM side, run the
+    ollama server with ``OLLAMA_NUM_PARALLEL=4`` (or higher).
     """
 
     # CMOP API connection
@@ -20,9 +25,22 @@ class Settings(BaseSettings):
     # Ollama / LLM
     model: str = "qwen3:14b" #"qwen3:30b-a3b"
     ollama_host: str = "http://localhost:11434"
+    # Keep the model resident between calls — a lapsed keep-alive means
+    # a multi-second reload on the next interactive turn
+    ollama_keep_alive: str = "30m"
+    # Ollama's default 2048-token context silently truncates the system
+    # prompt + tool schemas + preloaded CMOP state
+    ollama_num_ctx: int = 8192
+    ollama_num_batch: int = 512
 
     # Agent behaviour
     max_iterations: int = 15
+    # Tool results longer than this (chars) are truncated in the message
+    # history; the full payload is kept in the agent's tool cache.
+    tool_result_budget: int = 2000
+    # How many recent tool messages keep their content; older ones are
+    # collapsed to a placeholder to bound per-iteration prefill cost.
+    tool_history_window: int = 12
 
     # Tracing (OTel → Jaeger)
     otlp_endpoint: str = "http://localhost:4317"
@@ -30,3 +48,9 @@ class Settings(BaseSettings):
 
 
     model_config = {"env_prefix": "CMOP_"}
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Shared Settings instance — env is read and validated only once."""
+    return Settings()
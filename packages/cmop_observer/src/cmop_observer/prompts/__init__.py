@@ -4,6 +4,10 @@ cmop_observer/prompts
 System prompts for the CMOP Observer Agent.
 """
 
-from cmop_observer.prompts.system import SYSTEM_PROMPT
+from cmop_observer.prompts.system import (
+    SYSTEM_PROMPT,
+    SYSTEM_PROMPT_BYTES,
+    get_cached_system_prompt,
+)
 
-__all__ = ["SYSTEM_PROMPT"]
\ No newline at end of file
+__all__ = ["SYSTEM_PROMPT", "SYSTEM_PROMPT_BYTES", "get_cached_system_prompt"]
\ No newline at end of file
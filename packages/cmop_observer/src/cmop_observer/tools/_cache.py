@@ -0,0 +1,68 @@
+"""
+cmop_observer/tools/_cache.py
+
+Short-TTL response cache for deterministic read-only tools.
+
+During a single analysis the LLM often re-issues the same query (e.g.
+get_entity_by_id(42) to double-check a fact a few turns later); within
+a short window the CMOP answer is identical, so the repeat collapses
+to a cache hit instead of an HTTP round trip plus deserialization.
+"""
+
+from functools import wraps
+from hashlib import sha256
+from typing import Any, Awaitable, Callable
+
+import orjson
+from cachetools import TTLCache
+
+# Hit/miss counters across all cached tools, for observability.
+stats = {"hits": 0, "misses": 0}
+
+_caches: list[TTLCache] = []
+
+
+def cached(ttl: float = 15.0) -> Callable:
+    """
+    Cache an async tool's dict result, keyed by tool name + kwargs.
+
+    The key is a sha256 over the tool name and the kwargs serialized
+    with sorted keys, so argument order does not fragment entries.
+    Only successful responses are stored — errors always re-execute.
+
+    Args:
+        ttl: Seconds an entry stays valid (default 15).
+    """
+
+    def decorator(func: Callable[..., Awaitable[dict]]) -> Callable:
+        store: TTLCache = TTLCache(maxsize=1024, ttl=ttl)
+        _caches.append(store)
+        name = func.__name__.encode()
+
+        @wraps(func)
+        async def wrapper(**kwargs: Any) -> dict:
+            key = sha256(
+                name + b"\0" + orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS)
+            ).hexdigest()
+            try:
+                result = store[key]
+            except KeyError:
+                stats["misses"] += 1
+            else:
+                stats["hits"] += 1
+                return result
+            result = await func(**kwargs)
+            if result.get("success"):
+                store[key] = result
+            return result
+
+        wrapper.cache = store
+        return wrapper
+
+    return decorator
+
+
+def clear_all() -> None:
+    """Drop every cached response (e.g. after a scenario switch)."""
+    for store in _caches:
+        store.clear()
@@ -3,95 +3,169 @@ cmop_observer/tools/basic.py
 
 Basic read-only tools for querying the CMOP API.
 Schemas are auto-generated from type hints and docstrings.
+
+The client is threaded through a ContextVar rather than closures, so
+the tool functions are plain module-level defs: no closure-cell lookup
+per call, and the client can be overridden per task if needed.
 """
 
+from contextvars import ContextVar
+
+import orjson
+from async_lru import alru_cache
+
 from cmop_observer.api.client import CMOPClient
+from cmop_observer.tools._cache import cached
+from latacc_common.models import ApiResponse
 from latacc_common.tools import ToolRegistry
 
+_client_var: ContextVar[CMOPClient] = ContextVar("cmop_client")
+
+
+def dump_response(result: ApiResponse) -> dict:
+    """
+    Serialize an ApiResponse for a tool return value.
+
+    model_dump_json goes through pydantic-core's Rust serializer, which
+    is much faster than the Python-side model_dump walker on large
+    entity payloads; orjson turns the JSON back into the dict the tool
+    transport expects.
+    """
+    return orjson.loads(result.model_dump_json(exclude_none=True))
+
+
+def clear_schema_cache() -> None:
+    """Invalidate the cached schema/scenario responses."""
+    _fetch_schema.cache_clear()
+    _fetch_scenarios.cache_clear()
+
+
+# Schema and scenarios are static per process lifetime, so the inner
+# fetches are memoized (not the registered tools themselves — the
+# registry still sees plain async functions). Failed fetches are
+# evicted so an early connection error is not pinned.
+@alru_cache(maxsize=1)
+async def _fetch_schema() -> dict:
+    return dump_response(await _client_var.get().get_schema())
+
+
+@alru_cache(maxsize=1)
+async def _fetch_scenarios() -> dict:
+    return dump_response(await _client_var.get().get_scenarios())
+
+
+async def get_all_entities() -> dict:
+    """Get all entities from CMOP map (military units, casualties, facilities)."""
+    result = await _client_var.get().get_entities()
+    return dump_response(result)
+
+
+@cached()
+async def get_entity_by_id(entity_id: int) -> dict:
+    """Get single entity by numeric ID with full medical details."""
+    result = await _client_var.get().get_entity(entity_id)
+    return dump_response(result)
+
+
+@cached()
+async def get_entities_by_category(category: str) -> dict:
+    """Get entities filtered by category.
+
+    Args:
+        category: Entity category (infantry, armoured, casualty, medical_facility, medevac_unit, etc.).
+    """
+    result = await _client_var.get().get_entities_by_category(category)
+    return dump_response(result)
+
+
+@cached()
+async def get_casualties() -> dict:
+    """Get all casualties (entities with medical records) including triage, evac stage, vital signs, and 9-Line data."""
+    result = await _client_var.get().get_casualties()
+    return dump_response(result)
+
+
+@cached()
+async def get_casualties_by_triage(color: str) -> dict:
+    """Get casualties filtered by triage color.
+
+    Args:
+        color: Triage color — RED (T1 immediate), YELLOW (T2 urgent), GREEN (T3 minimal), BLUE (T4 expectant), BLACK (deceased), UNKNOWN.
+    """
+    result = await _client_var.get().get_casualties_by_triage(color)
+    return dump_response(result)
+
+
+@cached()
+async def get_casualties_by_evac_stage(stage: str) -> dict:
+    """Get casualties filtered by evacuation stage.
+
+    Args:
+        stage: Evacuation stage — at_poi (point of injury), in_transit (being evacuated), delivered (at facility), unknown.
+    """
+    result = await _client_var.get().get_casualties_by_evac_stage(stage)
+    return dump_response(result)
+
+
+async def get_nearby_entities(
+    longitude: float, latitude: float, radius_m: int = 5000
+) -> dict:
+    """Find entities within radius of coordinates.
+
+    Args:
+        longitude: WGS84 longitude.
+        latitude: WGS84 latitude.
+        radius_m: Search radius in meters (default 5000).
+    """
+    result = await _client_var.get().get_nearby_entities(
+        longitude, latitude, radius_m
+    )
+    return dump_response(result)
+
+
+@cached()
+async def get_nine_line(entity_id: int) -> dict:
+    """Get the 9-Line MEDEVAC request data for a specific casualty.
+
+    Args:
+        entity_id: Casualty entity ID.
+    """
+    result = await _client_var.get().get_nine_line(entity_id)
+    return dump_response(result)
+
+
+async def get_schema() -> dict:
+    """Get CMOP schema with valid categories, triage colors, evac stages, facility roles, and 9-Line MEDEVAC format."""
+    result = await _fetch_schema()
+    if not result.get("success"):
+        _fetch_schema.cache_clear()
+    return result
+
+
+async def get_available_scenarios() -> dict:
+    """List available scenarios that can be loaded."""
+    result = await _fetch_scenarios()
+    if not result.get("success"):
+        _fetch_scenarios.cache_clear()
+    return result
+
+
+_BASIC_TOOLS = (
+    get_all_entities,
+    get_entity_by_id,
+    get_entities_by_category,
+    get_casualties,
+    get_casualties_by_triage,
+    get_casualties_by_evac_stage,
+    get_nearby_entities,
+    get_nine_line,
+    get_schema,
+    get_available_scenarios,
+)
+
 
 def register_basic_tools(registry: ToolRegistry, client: CMOPClient) -> None:
     """Register all basic CMOP API query tools."""
-
-    @registry.register
-    async def get_all_entities() -> dict:
-        """Get all entities from CMOP map (military units, casualties, facilities)."""
-        result = await client.get_entities()
-        return result.model_dump(exclude_none=True)
-
-    @registry.register
-    async def get_entity_by_id(entity_id: int) -> dict:
-        """Get single entity by numeric ID with full medical details."""
-        result = await client.get_entity(entity_id)
-        return result.model_dump(exclude_none=True)
-
-    @registry.register
-    async def get_entities_by_category(category: str) -> dict:
-        """Get entities filtered by category.
-
-        Args:
-            category: Entity category (infantry, armoured, casualty, medical_facility, medevac_unit, etc.).
-        """
-        result = await client.get_entities_by_category(category)
-        return result.model_dump(exclude_none=True)
-
-    @registry.register
-    async def get_casualties() -> dict:
-        """Get all casualties (entities with medical records) including triage, evac stage, vital signs, and 9-Line data."""
-        result = await client.get_casualties()
-        return result.model_dump(exclude_none=True)
-
-    @registry.register
-    async def get_casualties_by_triage(color: str) -> dict:
-        """Get casualties filtered by triage color.
-
-        Args:
-            color: Triage color — RED (T1 immediate), YELLOW (T2 urgent), GREEN (T3 minimal), BLUE (T4 expectant), BLACK (deceased), UNKNOWN.
-        """
-        result = await client.get_casualties_by_triage(color)
-        return result.model_dump(exclude_none=True)
-
-    @registry.register
-    async def get_casualties_by_evac_stage(stage: str) -> dict:
-        """Get casualties filtered by evacuation stage.
-
-        Args:
-            stage: Evacuation stage — at_poi (point of injury), in_transit (being evacuated), delivered (at facility), unknown.
-        """
-        result = await client.get_casualties_by_evac_stage(stage)
-        return result.model_dump(exclude_none=True)
-
-    @registry.register
-    async def get_nearby_entities(
-        longitude: float, latitude: float, radius_m: int = 5000
-    ) -> dict:
-        """Find entities within radius of coordinates.
-
-        Args:
-            longitude: WGS84 longitude.
-            latitude: WGS84 latitude.
-            radius_m: Search radius in meters (default 5000).
-        """
-        result = await client.get_nearby_entities(longitude, latitude, radius_m)
-        return result.model_dump(exclude_none=True)
-
-    @registry.register
-    async def get_nine_line(entity_id: int) -> dict:
-        """Get the 9-Line MEDEVAC request data for a specific casualty.
-
-        Args:
-            entity_id: Casualty entity ID.
-        """
-        result = await client.get_nine_line(entity_id)
-        return result.model_dump(exclude_none=True)
-
-    @registry.register
-    async def get_schema() -> dict:
-        """Get CMOP schema with valid categories, triage colors, evac stages, facility roles, and 9-Line MEDEVAC format."""
-        result = await client.get_schema()
-        return result.model_dump(exclude_none=True)
-
-    @registry.register
-    async def get_available_scenarios() -> dict:
-        """List available scenarios that can be loaded."""
-        result = await client.get_scenarios()
-        return result.model_dump(exclude_none=True)
+    _client_var.set(client)
+    for tool in _BASIC_TOOLS:
+        registry.register(tool)
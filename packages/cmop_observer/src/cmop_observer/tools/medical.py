@@ -6,14 +6,108 @@ Composes basic API calls with deterministic domain logic
 so the LLM doesn't have to do math or complex reasoning.
 """
 
+import asyncio
+import heapq
+from collections import Counter
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from math import cos, radians
+from operator import itemgetter
+
+import numpy as np
 
 from cmop_observer.api.client import CMOPClient
-from cmop_observer.utils import estimate_ground_eta, haversine_distance
+from cmop_observer.tools.basic import dump_response
+from cmop_observer.utils import (
+    equirect_distance_batch,
+    estimate_ground_eta,
+    haversine_distance_batch,
+)
 from latacc_common.models.enums import FacilityRole
 from latacc_common.tools import ToolRegistry
 
 
+# Facility role → numeric level, precomputed at import: avoids
+# constructing the enum (and unwinding ValueError for unknown roles)
+# once per facility inside the ranking loop
+_ROLE_LEVEL: dict[str, int] = {r.value: r.level for r in FacilityRole}
+
+# Shared scaffolding for the "nothing found" responses — only the
+# message varies, so the common keys are built once
+_EMPTY_RESULT_TEMPLATE = {"success": True, "data": None, "action": "inform"}
+
+
+@dataclass(slots=True)
+class ComplianceResult:
+    """
+    10-1-2 compliance assessment for one casualty.
+
+    A slotted dataclass instead of a hand-built dict literal: fixed
+    attribute layout, no per-call hash-table growth, and the field list
+    documents the response shape in one place. Serialized with
+    :func:`dataclasses.asdict` only at the return boundary.
+    """
+
+    entity_id: int
+    name: str | None = None
+    triage_color: str = "UNKNOWN"
+    casualty_status: str = "UNKNOWN"
+    evac_stage: str = "unknown"
+    evac_priority: str = "UNKNOWN"
+    time_since_injury_minutes: int = 0
+    injury_timestamp: str | None = None
+    destination_facility: dict | None = None
+    timeline_status: dict[str, str] = field(default_factory=dict)
+    recommendations: list[str] = field(default_factory=list)
+
+
+def _as_columns(casualties: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Transpose casualty dicts into parallel triage/evac/status arrays.
+
+    The MASCAL aggregation only needs three medical fields per casualty;
+    one structure-of-arrays pass up front lets the counting happen with
+    np.unique in C instead of repeated dict lookups per casualty.
+    """
+    triage = np.empty(len(casualties), dtype=object)
+    evac = np.empty(len(casualties), dtype=object)
+    status = np.empty(len(casualties), dtype=object)
+    for i, c in enumerate(casualties):
+        med = c.get("medical") or {}
+        # `or` rather than a .get default: explicit JSON nulls must land
+        # in the UNKNOWN buckets too, or np.unique trips comparing None
+        # against strings
+        triage[i] = med.get("triage_color") or "UNKNOWN"
+        evac[i] = med.get("evac_stage") or "unknown"
+        status[i] = med.get("casualty_status") or "UNKNOWN"
+    return triage, evac, status
+
+
+def _count_unique(arr: np.ndarray, seed: dict[str, int]) -> dict[str, int]:
+    """Bucket counts from np.unique, merged over pre-seeded zero buckets."""
+    counts = dict(seed)
+    if arr.size:
+        vals, n = np.unique(arr, return_counts=True)
+        counts.update(zip(vals.tolist(), n.tolist()))
+    return counts
+
+
+@lru_cache(maxsize=512)
+def _parse_iso(ts: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, memoized.
+
+    The same casualty is re-checked across reasoning turns during a
+    MASCAL analysis; the timestamp string immutably identifies the
+    injury event, so caching the parsed datetime is safe.
+
+    fromisoformat accepts the trailing ``Z`` natively on the Python
+    versions this project supports (>=3.12), so no fixup pass is needed.
+    """
+    return datetime.fromisoformat(ts)
+
+
 def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
     """Register medical domain analysis tools."""
 
@@ -36,60 +130,79 @@ def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
             casualty_lng, casualty_lat, max_distance_m
         )
         if not nearby.success:
-            return nearby.model_dump(exclude_none=True)
+            return dump_response(nearby)
 
         entities = nearby.data or []
-        facilities = [e for e in entities if e.get("categoria") == "medical_facility"]
+
+        # Degree-window bounding box: a pair of abs comparisons per
+        # entity rejects anything outside the search radius before the
+        # role lookup and the trig pass. The server's radius filter can
+        # be generous, so this also tightens the candidate set.
+        deg_lat = max_distance_m / 111_320
+        deg_lon = deg_lat / max(cos(radians(casualty_lat)), 1e-6)
+        facilities = [
+            e
+            for e in entities
+            if e.get("categoria") == "medical_facility"
+            and abs(e["latitud"] - casualty_lat) <= deg_lat
+            and abs(e["longitud"] - casualty_lng) <= deg_lon
+        ]
 
         if not facilities:
             return {
-                "success": True,
-                "data": None,
+                **_EMPTY_RESULT_TEMPLATE,
                 "message": f"No medical facilities found within {max_distance_m}m",
-                "action": "inform",
             }
 
-        eligible = []
+        candidates = []
         for f in facilities:
             tipo = f.get("tipo_elemento", "")
-            try:
-                role = FacilityRole(tipo)
-                role_level = role.level
-            except ValueError:
-                role_level = 0
-
+            role_level = _ROLE_LEVEL.get(tipo, 0)
             if role_level >= min_role:
-                dist = haversine_distance(
-                    casualty_lng, casualty_lat,
-                    f["longitud"], f["latitud"],
-                )
-                eligible.append({
-                    "id": f["id"],
-                    "name": f.get("nombre"),
-                    "role": tipo,
-                    "role_level": role_level,
-                    "distance_m": int(dist),
-                    "eta_minutes": estimate_ground_eta(dist),
-                    "latitude": f["latitud"],
-                    "longitude": f["longitud"],
-                    "country": f.get("country"),
-                    "alliance": f.get("alliance"),
-                })
-
-        if not eligible:
+                candidates.append((f, tipo, role_level))
+
+        if not candidates:
             return {
-                "success": True,
-                "data": None,
+                **_EMPTY_RESULT_TEMPLATE,
                 "message": f"No Role {min_role}+ facilities within {max_distance_m}m",
-                "action": "inform",
             }
 
-        eligible.sort(key=lambda x: x["distance_m"])
+        # Distances in one vectorized pass over the eligible facilities.
+        # Within 50 km the equirectangular approximation is exact to
+        # well under a meter and markedly cheaper than haversine.
+        lons = np.fromiter((f["longitud"] for f, _, _ in candidates), dtype=np.float64)
+        lats = np.fromiter((f["latitud"] for f, _, _ in candidates), dtype=np.float64)
+        distance_batch = (
+            equirect_distance_batch
+            if max_distance_m <= 50_000
+            else haversine_distance_batch
+        )
+        distances = distance_batch(casualty_lng, casualty_lat, lons, lats)
+
+        eligible = [
+            {
+                "id": f["id"],
+                "name": f.get("nombre"),
+                "role": tipo,
+                "role_level": role_level,
+                "distance_m": int(dist),
+                "eta_minutes": estimate_ground_eta(dist),
+                "latitude": f["latitud"],
+                "longitude": f["longitud"],
+                "country": f.get("country"),
+                "alliance": f.get("alliance"),
+            }
+            for (f, tipo, role_level), dist in zip(candidates, distances)
+        ]
+
+        # Only the nearest + 3 alternatives are reported — O(N log 4)
+        # instead of a full sort
+        top4 = heapq.nsmallest(4, eligible, key=itemgetter("distance_m"))
         return {
             "success": True,
             "data": {
-                "nearest": eligible[0],
-                "alternatives": eligible[1:4],
+                "nearest": top4[0],
+                "alternatives": top4[1:],
             },
         }
 
@@ -102,7 +215,7 @@ def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
         """
         result = await client.get_entity(entity_id)
         if not result.success:
-            return result.model_dump(exclude_none=True)
+            return dump_response(result)
 
         entity = result.data
         if not entity:
@@ -133,9 +246,7 @@ def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
             }
 
         try:
-            injury_time = datetime.fromisoformat(
-                str(created_at_str).replace("Z", "+00:00")
-            )
+            injury_time = _parse_iso(str(created_at_str))
         except (ValueError, TypeError) as exc:
             return {
                 "success": False,
@@ -153,6 +264,18 @@ def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
         evac_priority = medical.get("evac_priority", "UNKNOWN")
         is_red = triage == "RED"
 
+        report = ComplianceResult(
+            entity_id=entity_id,
+            name=entity.get("nombre"),
+            triage_color=triage,
+            casualty_status=casualty_status,
+            evac_stage=evac_stage,
+            evac_priority=evac_priority,
+            time_since_injury_minutes=elapsed_minutes,
+            injury_timestamp=created_at_str,
+            destination_facility=medical.get("destination_facility"),
+        )
+
         # Skip timeline check for KIA
         if casualty_status == "KIA":
             return {
@@ -167,7 +290,7 @@ def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
             }
 
         # Timeline assessment
-        timeline = {}
+        timeline = report.timeline_status
 
         # 10-minute rule (first aid at POI)
         if elapsed_minutes <= 10:
@@ -192,7 +315,7 @@ def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
             timeline["dcs_2hour"] = "VIOLATED" if is_red else "AT_RISK"
 
         # Recommendations
-        recommendations = []
+        recommendations = report.recommendations
         if is_red and evac_stage == "at_poi" and elapsed_minutes > 30:
             recommendations.append(
                 "URGENT: RED casualty still at POI after 30min — "
@@ -214,76 +337,61 @@ def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
                 "coordinate immediate evacuation asset"
             )
 
-        # Destination facility info
-        dest_facility = medical.get("destination_facility")
+        if not recommendations:
+            recommendations.append("Timeline compliant")
 
-        return {
-            "success": True,
-            "data": {
-                "entity_id": entity_id,
-                "name": entity.get("nombre"),
-                "triage_color": triage,
-                "casualty_status": casualty_status,
-                "evac_stage": evac_stage,
-                "evac_priority": evac_priority,
-                "time_since_injury_minutes": elapsed_minutes,
-                "injury_timestamp": created_at_str,
-                "destination_facility": dest_facility,
-                "timeline_status": timeline,
-                "recommendations": recommendations or ["Timeline compliant"],
-            },
-        }
+        return {"success": True, "data": asdict(report)}
 
     @registry.register
     async def get_mascal_summary() -> dict:
         """Get MASCAL situation overview: casualties by triage/stage/status, facilities, risk assessment."""
-        casualties_resp = await client.get_casualties()
+        # Independent reads — fetch concurrently
+        casualties_resp, facilities_resp = await asyncio.gather(
+            client.get_casualties(),
+            client.get_entities_by_category("medical_facility"),
+        )
         if not casualties_resp.success:
-            return casualties_resp.model_dump(exclude_none=True)
-
-        casualties = casualties_resp.data or []
-
-        facilities_resp = await client.get_entities_by_category("medical_facility")
+            return dump_response(casualties_resp)
         if not facilities_resp.success:
-            return facilities_resp.model_dump(exclude_none=True)
+            return dump_response(facilities_resp)
 
+        casualties = casualties_resp.data or []
         facilities = facilities_resp.data or []
 
-        # Aggregate triage, evac stage, and casualty status
-        triage_counts: dict[str, int] = {
-            "RED": 0, "YELLOW": 0, "GREEN": 0, "BLUE": 0, "BLACK": 0, "UNKNOWN": 0,
-        }
-        evac_counts: dict[str, int] = {
-            "at_poi": 0, "in_transit": 0, "delivered": 0, "unknown": 0,
-        }
-        status_counts: dict[str, int] = {"WIA": 0, "KIA": 0, "UNKNOWN": 0}
-        critical_at_poi: list[dict] = []
-
-        for c in casualties:
-            med = c.get("medical", {})
-            triage = med.get("triage_color", "UNKNOWN")
-            evac = med.get("evac_stage", "unknown")
-            status = med.get("casualty_status", "UNKNOWN")
-
-            triage_counts[triage] = triage_counts.get(triage, 0) + 1
-            evac_counts[evac] = evac_counts.get(evac, 0) + 1
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-            if triage == "RED" and evac == "at_poi":
-                critical_at_poi.append({
-                    "id": c["id"],
-                    "name": c.get("nombre"),
-                    "latitude": c.get("latitud"),
-                    "longitude": c.get("longitud"),
-                    "evac_priority": med.get("evac_priority", "UNKNOWN"),
-                    "injury_mechanism": med.get("injury_mechanism"),
-                })
+        # Transpose to columns once, then count each column with a
+        # single np.unique C call instead of per-casualty dict lookups.
+        # Seeds keep the zero buckets in the output.
+        triage_arr, evac_arr, status_arr = _as_columns(casualties)
+        triage_counts = _count_unique(
+            triage_arr,
+            {"RED": 0, "YELLOW": 0, "GREEN": 0, "BLUE": 0, "BLACK": 0, "UNKNOWN": 0},
+        )
+        evac_counts = _count_unique(
+            evac_arr, {"at_poi": 0, "in_transit": 0, "delivered": 0, "unknown": 0}
+        )
+        status_counts = _count_unique(status_arr, {"WIA": 0, "KIA": 0, "UNKNOWN": 0})
+
+        critical_mask = (triage_arr == "RED") & (evac_arr == "at_poi")
+        critical_count = int(np.count_nonzero(critical_mask))
+        # Only the first 5 critical casualties are detailed — build
+        # dicts just for those rows
+        critical_at_poi = []
+        for i in np.flatnonzero(critical_mask)[:5].tolist():
+            c = casualties[i]
+            med = c.get("medical") or {}
+            critical_at_poi.append({
+                "id": c["id"],
+                "name": c.get("nombre"),
+                "latitude": c.get("latitud"),
+                "longitude": c.get("longitud"),
+                "evac_priority": med.get("evac_priority", "UNKNOWN"),
+                "injury_mechanism": med.get("injury_mechanism"),
+            })
 
         # Facility breakdown
-        facility_counts: dict[str, int] = {}
-        for f in facilities:
-            role = f.get("tipo_elemento", "unknown")
-            facility_counts[role] = facility_counts.get(role, 0) + 1
+        facility_counts = Counter(
+            f.get("tipo_elemento", "unknown") for f in facilities
+        )
 
         # MASCAL risk assessment
         red = triage_counts["RED"]
@@ -309,8 +417,8 @@ def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
                 "triage_distribution": triage_counts,
                 "evac_stage_distribution": evac_counts,
                 "casualty_status_distribution": status_counts,
-                "critical_at_poi_count": len(critical_at_poi),
-                "critical_at_poi": critical_at_poi[:5],
+                "critical_at_poi_count": critical_count,
+                "critical_at_poi": critical_at_poi,
                 "facilities_available": facility_counts,
                 "total_facilities": len(facilities),
                 "mascal_status": mascal_status,
@@ -318,7 +426,7 @@ def register_medical_tools(registry: ToolRegistry, client: CMOPClient) -> None:
                     "RED_casualties": red,
                     "YELLOW_casualties": triage_counts["YELLOW"],
                     "KIA_count": status_counts["KIA"],
-                    "immediate_evac_needed": len(critical_at_poi),
+                    "immediate_evac_needed": critical_count,
                     "overwhelmed_risk": risk_map[mascal_status],
                 },
             },
@@ -8,6 +8,7 @@ from latacc_common.models.api_response import ApiResponse, ErrorAction
 from latacc_common.models.entities import (
     DestinationFacility,
     Entity,
+    EntityListAdapter,
     MedicalRecord,
 )
 from latacc_common.models.enums import (
@@ -25,6 +26,7 @@ __all__ = [
     "CasualtyStatus",
     "DestinationFacility",
     "Entity",
+    "EntityListAdapter",
     "ErrorAction",
     "EvacPriority",
     "EvacStage",
@@ -32,3 +34,11 @@ __all__ = [
     "MedicalRecord",
     "TriageColor",
 ]
+
+# Pre-parametrize ApiResponse for the payload types seen on hot paths.
+# Pydantic builds a concrete model (core schema + serializer) per
+# parametrization lazily on first use; doing it at import keeps that
+# JIT-like cost off the first cold tool call.
+for _payload in (dict, list[dict], Entity, list[Entity]):
+    ApiResponse[_payload]
+del _payload
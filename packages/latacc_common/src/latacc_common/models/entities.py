@@ -4,11 +4,18 @@ latacc_common/models/entities.py
 Pydantic models for CMOP map entities and medical records.
 Field names and aliases match the JSON shape returned by the
 cmop_map API (entity.js baseSelect).
+
+All three models are pydantic dataclasses with ``slots=True``: a map
+refresh can hold thousands of entities, and slots drop the
+per-instance ``__dict__`` while keeping full pydantic validation and
+alias handling on construction. Required fields are listed before
+defaulted ones to satisfy dataclass ordering.
 """
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
 
 from latacc_common.models.enums import (
     Alliance,
@@ -19,16 +26,25 @@ from latacc_common.models.enums import (
 )
 
 
-class DestinationFacility(BaseModel):
-    """Resolved FK reference to the destination medical facility."""
+@dataclass(
+    frozen=True,
+    slots=True,
+    config=ConfigDict(populate_by_name=True),
+)
+class DestinationFacility:
+    """
+    Resolved FK reference to the destination medical facility.
 
-    id: int
-    name: str = Field(alias="nombre")
+    Frozen as well as slotted: it is a pure value object instantiated
+    per casualty, safe to share and hash.
+    """
 
-    model_config = {"populate_by_name": True}
+    id: int
+    name: str = Field(validation_alias="nombre")
 
 
-class MedicalRecord(BaseModel):
+@dataclass(slots=True, config=ConfigDict(extra="ignore"))
+class MedicalRecord:
     """
     Medical details attached to a casualty entity.
 
@@ -56,38 +72,45 @@ class MedicalRecord(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    model_config = {"extra": "ignore"}
-
 
-class Entity(BaseModel):
+@dataclass(
+    slots=True,
+    config=ConfigDict(populate_by_name=True, extra="ignore"),
+)
+class Entity:
     """
     A CMOP map entity (military unit, casualty, facility, etc.).
 
-    Field aliases map the Spanish-language API names to English
-    Python attributes. ``populate_by_name=True`` allows construction
-    with either name.
+    Validation aliases map the Spanish-language API names to English
+    Python attributes; dumps use the English names, so no
+    serialization-side alias resolution is paid.
+    ``populate_by_name=True`` allows construction with either name.
     """
 
     id: int
-    name: str = Field(alias="nombre")
-    description: str | None = Field(default=None, alias="descripcion")
-    category: str = Field(alias="categoria")
+    name: str = Field(validation_alias="nombre")
+    category: str = Field(validation_alias="categoria")
+    latitude: float = Field(validation_alias="latitud")
+    longitude: float = Field(validation_alias="longitud")
+    description: str | None = Field(default=None, validation_alias="descripcion")
     country: str | None = None
     alliance: Alliance = Alliance.UNKNOWN
     identified_element: str | None = Field(
-        default=None, alias="elemento_identificado"
+        default=None, validation_alias="elemento_identificado"
     )
-    active: bool = Field(default=True, alias="activo")
-    element_type: str | None = Field(default=None, alias="tipo_elemento")
-    priority: int = Field(default=0, alias="prioridad")
-    observations: str | None = Field(default=None, alias="observaciones")
-    altitude: float | None = Field(default=None, alias="altitud")
-    latitude: float = Field(alias="latitud")
-    longitude: float = Field(alias="longitud")
+    active: bool = Field(default=True, validation_alias="activo")
+    element_type: str | None = Field(default=None, validation_alias="tipo_elemento")
+    priority: int = Field(default=0, validation_alias="prioridad")
+    observations: str | None = Field(default=None, validation_alias="observaciones")
+    altitude: float | None = Field(default=None, validation_alias="altitud")
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
     # Medical record (null for non-casualty entities)
     medical: MedicalRecord | None = None
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+
+# Validates a whole entity list in one pydantic-core pass — use
+# EntityListAdapter.validate_python(rows) instead of constructing
+# Entity per row in a Python loop.
+EntityListAdapter: TypeAdapter[list[Entity]] = TypeAdapter(list[Entity])
@@ -68,13 +68,17 @@ class FacilityRole(StrEnum):
     @property
     def level(self) -> int:
         """Numeric role level for comparison and sorting."""
-        mapping = {
-            "medical_role_1": 1,
-            "medical_role_2": 2,
-            "medical_role_2basic": 2,
-            "medical_role_2enhanced": 2,
-            "medical_role_3": 3,
-            "medical_role_4": 4,
-            "medical_facility_multinational": 3,
-        }
-        return mapping.get(self.value, 0)
+        return _ROLE_LEVELS.get(self.value, 0)
+
+
+# Hoisted out of FacilityRole.level so sorting/comparing facilities
+# does not rebuild the dict on every property access.
+_ROLE_LEVELS: dict[str, int] = {
+    "medical_role_1": 1,
+    "medical_role_2": 2,
+    "medical_role_2basic": 2,
+    "medical_role_2enhanced": 2,
+    "medical_role_3": 3,
+    "medical_role_4": 4,
+    "medical_facility_multinational": 3,
+}
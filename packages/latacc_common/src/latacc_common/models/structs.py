@@ -0,0 +1,91 @@
+"""
+latacc_common/models/structs.py
+
+msgspec.Struct mirrors of the entity models for hot-path decoding.
+
+Decoding raw API bytes straight into these structs happens in a single
+C pass — an order of magnitude faster than pydantic validation when an
+agent ingests hundreds of entities per map refresh. The pydantic models
+in :mod:`latacc_common.models.entities` remain the validation surface
+for write paths and anything that needs coercion; these structs are a
+read-only fast path with the same field names and Spanish aliases.
+
+msgspec is an optional dependency of the agents, not of latacc_common:
+this module is only imported by callers that ship it, so the rest of
+the package works without it.
+"""
+
+from datetime import datetime
+
+import msgspec
+
+from latacc_common.models.enums import (
+    Alliance,
+    CasualtyStatus,
+    EvacPriority,
+    EvacStage,
+    TriageColor,
+)
+
+
+class DestinationFacilityStruct(msgspec.Struct):
+    """Resolved FK reference to the destination medical facility."""
+
+    id: int
+    name: str = msgspec.field(name="nombre")
+
+
+class MedicalRecordStruct(msgspec.Struct):
+    """Medical details attached to a casualty entity."""
+
+    triage_color: TriageColor = TriageColor.UNKNOWN
+    casualty_status: CasualtyStatus = CasualtyStatus.UNKNOWN
+    injury_mechanism: str | None = None
+    primary_injury: str | None = None
+    vital_signs: list[dict] | None = None
+    prehospital_treatment: str | None = None
+    evac_priority: EvacPriority = EvacPriority.UNKNOWN
+    evac_stage: EvacStage = EvacStage.UNKNOWN
+    destination_facility: DestinationFacilityStruct | None = None
+    nine_line_data: dict | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class EntityStruct(msgspec.Struct):
+    """A CMOP map entity decoded without per-field Python validation."""
+
+    id: int
+    name: str = msgspec.field(name="nombre")
+    latitude: float = msgspec.field(name="latitud")
+    longitude: float = msgspec.field(name="longitud")
+    category: str = msgspec.field(name="categoria")
+    description: str | None = msgspec.field(default=None, name="descripcion")
+    country: str | None = None
+    alliance: Alliance = Alliance.UNKNOWN
+    identified_element: str | None = msgspec.field(
+        default=None, name="elemento_identificado"
+    )
+    active: bool = msgspec.field(default=True, name="activo")
+    element_type: str | None = msgspec.field(default=None, name="tipo_elemento")
+    priority: int = msgspec.field(default=0, name="prioridad")
+    observations: str | None = msgspec.field(default=None, name="observaciones")
+    altitude: float | None = msgspec.field(default=None, name="altitud")
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    medical: MedicalRecordStruct | None = None
+
+
+# Reusable decoders — msgspec compiles the decode plan once per Decoder.
+ENTITY_DECODER = msgspec.json.Decoder(EntityStruct)
+ENTITY_LIST_DECODER = msgspec.json.Decoder(list[EntityStruct])
+
+
+def decode_entity(raw: bytes | str) -> EntityStruct:
+    """Decode one entity from raw API JSON."""
+    return ENTITY_DECODER.decode(raw)
+
+
+def decode_entities(raw: bytes | str) -> list[EntityStruct]:
+    """Decode an entity list from raw API JSON."""
+    return ENTITY_LIST_DECODER.decode(raw)
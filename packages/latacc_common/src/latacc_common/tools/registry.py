@@ -8,13 +8,20 @@ with arguments, response payload, and duration.
 
 import inspect
 import logging
+import re
 import time
 from enum import StrEnum
-from typing import Any, Callable, get_type_hints
+from functools import cache, lru_cache, partial
+from typing import Any, Awaitable, Callable, get_type_hints
 
 from opentelemetry import trace
 
-from latacc_common.tracing import record_error, truncate_json
+from latacc_common.tracing import (
+    is_tracing_enabled,
+    record_error,
+    truncate_json,
+    truncate_json_with_len,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +33,48 @@ _TYPE_MAP: dict[type, str] = {
     str: "string",
 }
 
+# Built schemas keyed by function identity, shared across registries.
+# get_type_hints (which resolves forward refs) and the docstring parse
+# are the costly part of registration; re-registering the same function
+# in another registry instance reuses the schema. The firstlineno in
+# the key guards against a redefined function shadowing a stale entry.
+_SCHEMA_CACHE: dict[tuple[str, str, int], dict[str, Any]] = {}
 
+
+@cache
+def _get_tracer() -> trace.Tracer:
+    """
+    Shared tracer for all registries, resolved lazily.
+
+    trace.get_tracer walks the global provider registry; one lookup per
+    process suffices for every ToolRegistry instance. Lazy (rather than
+    at import) so init_tracing() has a chance to install the real
+    provider before the first registry is built.
+    """
+    return trace.get_tracer("latacc.tools")
+
+
+@lru_cache(maxsize=512)
+def _cached_type_hints(func: Callable) -> dict[str, Any]:
+    """
+    get_type_hints, memoized by function identity.
+
+    Hint resolution evaluates __annotations__ against module globals —
+    the costliest step of schema building — and functions are hashable,
+    so re-registering the same tool skips it entirely.
+    """
+    return get_type_hints(func)
+
+
+@lru_cache(maxsize=256)
 def _json_schema_type(hint: type) -> dict[str, Any]:
-    """Convert a Python type hint to a JSON Schema property."""
+    """
+    Convert a Python type hint to a JSON Schema property template.
+
+    Cached per hint, so the enum-value walk for StrEnum parameters runs
+    once per enum class rather than once per registration. The returned
+    dict is shared — callers copy it before mutating.
+    """
     if isinstance(hint, type) and issubclass(hint, StrEnum):
         return {
             "type": "string",
@@ -37,30 +83,25 @@ def _json_schema_type(hint: type) -> dict[str, Any]:
     return {"type": _TYPE_MAP.get(hint, "string")}
 
 
+# Compiled once: _ARGS_RE grabs the indented block under "Args:",
+# _PARAM_RE pulls the name/description pairs out of it. One C-level
+# traversal each instead of per-line Python string ops.
+_ARGS_RE = re.compile(r"^[ \t]*[Aa]rgs:[ \t]*\n((?:[ \t]+.+\n?)+)", re.MULTILINE)
+_PARAM_RE = re.compile(r"^[ \t]*-?[ \t]*(\w+)[ \t]*:[ \t]*(.+?)[ \t]*$", re.MULTILINE)
+
+
 def _parse_docstring_params(docstring: str) -> dict[str, str]:
     """
     Extract parameter descriptions from Google-style docstrings.
 
     Parses the 'Args:' section to map parameter names to descriptions.
     """
-    params: dict[str, str] = {}
     if not docstring:
-        return params
-
-    in_args = False
-    for line in docstring.split("\n"):
-        stripped = line.strip()
-        if stripped.lower().startswith("args:"):
-            in_args = True
-            continue
-        if in_args:
-            if stripped and not stripped.startswith("-") and ":" not in stripped:
-                break
-            if ":" in stripped:
-                name, _, desc = stripped.lstrip("- ").partition(":")
-                params[name.strip()] = desc.strip()
-
-    return params
+        return {}
+    match = _ARGS_RE.search(docstring)
+    if match is None:
+        return {}
+    return dict(_PARAM_RE.findall(match.group(1)))
 
 
 class ToolRegistry:
@@ -77,7 +118,10 @@ class ToolRegistry:
     def __init__(self) -> None:
         self._tools: dict[str, Callable] = {}
         self._schemas: list[dict[str, Any]] = []
-        self._tracer = trace.get_tracer("latacc.tools")
+        self._schemas_snapshot: tuple[dict[str, Any], ...] | None = None
+        self._names_snapshot: tuple[str, ...] | None = None
+        self._span_names: dict[str, str] = {}
+        self._tracer = _get_tracer()
 
     def register(self, func: Callable) -> Callable:
         """Register a tool function and auto-generate its OpenAI schema."""
@@ -87,12 +131,29 @@ class ToolRegistry:
 
         self._tools[name] = func
         self._schemas.append(self._build_schema(func))
+        self._schemas_snapshot = None
+        self._names_snapshot = None
+        # Span name interned once here rather than interpolated per call
+        self._span_names[name] = f"tool:{name}"
         logger.debug("Registered tool: %s", name)
         return func
 
     def _build_schema(self, func: Callable) -> dict[str, Any]:
-        """Generate OpenAI-compatible function schema from type hints."""
-        hints = get_type_hints(func)
+        """Generate OpenAI-compatible function schema from type hints.
+
+        Results are memoized in _SCHEMA_CACHE; callers treat the
+        returned dict as read-only.
+        """
+        cache_key = (
+            func.__module__,
+            func.__qualname__,
+            func.__code__.co_firstlineno,
+        )
+        cached = _SCHEMA_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        hints = _cached_type_hints(func)
         sig = inspect.signature(func)
         docstring = inspect.getdoc(func) or ""
         param_docs = _parse_docstring_params(docstring)
@@ -105,7 +166,7 @@ class ToolRegistry:
                 continue
 
             hint = hints.get(param_name, str)
-            prop = _json_schema_type(hint)
+            prop = dict(_json_schema_type(hint))
             prop["description"] = param_docs.get(param_name, param_name)
 
             if param.default is inspect.Parameter.empty:
@@ -117,7 +178,7 @@ class ToolRegistry:
 
         description = docstring.split("\n")[0] if docstring else func.__name__
 
-        return {
+        schema = {
             "type": "function",
             "function": {
                 "name": func.__name__,
@@ -129,16 +190,39 @@ class ToolRegistry:
                 },
             },
         }
+        _SCHEMA_CACHE[cache_key] = schema
+        return schema
 
     @property
-    def schemas(self) -> list[dict[str, Any]]:
-        """OpenAI-compatible tool schemas for LLM tool calling."""
-        return list(self._schemas)
+    def schemas(self) -> tuple[dict[str, Any], ...]:
+        """OpenAI-compatible tool schemas for LLM tool calling.
+
+        Returned as a cached tuple — agents read this on every LLM
+        turn, so the snapshot is rebuilt only after register() runs.
+        """
+        if self._schemas_snapshot is None:
+            self._schemas_snapshot = tuple(self._schemas)
+        return self._schemas_snapshot
 
     @property
-    def tool_names(self) -> list[str]:
-        """List of registered tool names."""
-        return list(self._tools.keys())
+    def tool_names(self) -> tuple[str, ...]:
+        """Registered tool names, as a cached tuple snapshot."""
+        if self._names_snapshot is None:
+            self._names_snapshot = tuple(self._tools)
+        return self._names_snapshot
+
+    def build_dispatch(self) -> dict[str, Callable[[dict[str, Any]], Awaitable[Any]]]:
+        """
+        Materialize a per-tool dispatch table keyed by name.
+
+        Each entry binds the tool name and function once, so hot-path
+        callers skip the registry lookup in execute() while keeping the
+        full tracing wrapper.
+        """
+        return {
+            name: partial(self._execute_tool, name, func)
+            for name, func in self._tools.items()
+        }
 
     async def execute(self, name: str, arguments: dict[str, Any]) -> Any:
         """
@@ -147,44 +231,68 @@ class ToolRegistry:
         The span records: tool name, arguments, response (truncated),
         duration in ms, and success/error status.
         """
-        if name not in self._tools:
-            raise KeyError(
-                f"Unknown tool '{name}'. Available: {', '.join(self._tools)}"
-            )
-
-        func = self._tools[name]
-
-        with self._tracer.start_as_current_span(f"tool:{name}") as span:
-            span.set_attribute("tool.name", name)
-            span.set_attribute("tool.arguments", truncate_json(arguments))
-
-            logger.info("Executing tool: %s(%s)", name, arguments)
-            start = time.perf_counter()
+        func = self._tools.get(name)
+        if func is None:
+            raise self._unknown_tool(name) from None
+
+        return await self._execute_tool(name, func, arguments)
+
+    def _unknown_tool(self, name: str) -> KeyError:
+        """Build the unknown-tool error off the dispatch hot path."""
+        return KeyError(
+            f"Unknown tool '{name}'. Available: {', '.join(self._tools)}"
+        )
+
+    async def _execute_tool(
+        self, name: str, func: Callable, arguments: dict[str, Any]
+    ) -> Any:
+        """Run a known tool function inside its OTel span."""
+        # Payload attributes are only worth serializing when spans are
+        # actually exported; a no-op provider would discard the strings
+        tracing_on = is_tracing_enabled()
+        span_name = self._span_names.get(name) or f"tool:{name}"
+        with self._tracer.start_as_current_span(span_name) as span:
+            if tracing_on:
+                span.set_attribute("tool.name", name)
+                span.set_attribute("tool.arguments", truncate_json(arguments))
+
+            # Arguments are already on the span (tool.arguments); keeping
+            # them out of the log line avoids a second repr of what can
+            # be a large dict on every call
+            logger.info("Executing tool: %s", name)
+            # Integer nanosecond counter: no float subtraction per sample
+            start_ns = time.perf_counter_ns()
 
             try:
                 result = await func(**arguments)
-                elapsed_ms = (time.perf_counter() - start) * 1000
-
-                span.set_attribute("tool.success", True)
-                span.set_attribute("tool.duration_ms", round(elapsed_ms, 1))
-                span.set_attribute("tool.response", truncate_json(result))
-
-                # Log response size for debugging context window issues
-                response_chars = len(
-                    truncate_json(result, max_chars=999_999)
-                )
-                span.set_attribute("tool.response_chars", response_chars)
-                logger.info(
-                    "Tool %s completed in %.0fms (%d chars response)",
-                    name,
-                    elapsed_ms,
-                    response_chars,
-                )
+                elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+                if tracing_on:
+                    span.set_attribute("tool.success", True)
+                    span.set_attribute("tool.duration_ms", round(elapsed_ms, 1))
+
+                    # One serialization yields both the span attribute
+                    # and the size (logged for context window debugging)
+                    response_text, response_chars = truncate_json_with_len(
+                        result
+                    )
+                    span.set_attribute("tool.response", response_text)
+                    span.set_attribute("tool.response_chars", response_chars)
+                    logger.info(
+                        "Tool %s completed in %.0fms (%d chars response)",
+                        name,
+                        elapsed_ms,
+                        response_chars,
+                    )
+                else:
+                    logger.info(
+                        "Tool %s completed in %.0fms", name, elapsed_ms
+                    )
 
                 return result
 
             except TypeError as exc:
-                elapsed_ms = (time.perf_counter() - start) * 1000
+                elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                 span.set_attribute("tool.success", False)
                 span.set_attribute("tool.duration_ms", round(elapsed_ms, 1))
                 record_error(span, exc)
@@ -197,7 +305,7 @@ class ToolRegistry:
                 }
 
             except Exception as exc:
-                elapsed_ms = (time.perf_counter() - start) * 1000
+                elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                 span.set_attribute("tool.success", False)
                 span.set_attribute("tool.duration_ms", round(elapsed_ms, 1))
                 record_error(span, exc)
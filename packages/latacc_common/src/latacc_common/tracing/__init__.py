@@ -8,8 +8,26 @@ Graceful degradation: if Jaeger is unavailable, tracing is a no-op.
 
 import json
 import logging
+from itertools import islice
 from typing import Any
 
+try:
+    # Optional: serializes span payloads several times faster than
+    # stdlib json and handles datetimes/UUIDs natively. Agents pull it
+    # in anyway; the stdlib branch keeps latacc_common dependency-free.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+        OTLPSpanExporter,
+    )
+
+    _OTLP_AVAILABLE = True
+except ImportError:
+    _OTLP_AVAILABLE = False
+
 from opentelemetry import trace
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
@@ -19,6 +37,7 @@ from opentelemetry.trace import StatusCode
 logger = logging.getLogger(__name__)
 
 _initialized = False
+_exporter_ok = False
 
 
 def init_tracing(
@@ -39,7 +58,7 @@ def init_tracing(
     Returns:
         A configured Tracer instance.
     """
-    global _initialized
+    global _initialized, _exporter_ok
 
     if _initialized:
         return trace.get_tracer(service_name)
@@ -48,21 +67,23 @@ def init_tracing(
 
     provider = TracerProvider(resource=resource)
 
-    try:
-        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
-            OTLPSpanExporter,
-        )
-
-        exporter = OTLPSpanExporter(endpoint=otlp_endpoint, insecure=True)
-        provider.add_span_processor(BatchSpanProcessor(exporter))
-        logger.info(
-            "OTel tracing enabled → %s (service: %s)",
-            otlp_endpoint,
-            service_name,
-        )
-    except Exception as exc:
+    if _OTLP_AVAILABLE:
+        try:
+            exporter = OTLPSpanExporter(endpoint=otlp_endpoint, insecure=True)
+            provider.add_span_processor(BatchSpanProcessor(exporter))
+            _exporter_ok = True
+            logger.info(
+                "OTel tracing enabled → %s (service: %s)",
+                otlp_endpoint,
+                service_name,
+            )
+        except Exception as exc:
+            logger.warning(
+                "OTel exporter init failed (%s). Tracing will be no-op.", exc
+            )
+    else:
         logger.warning(
-            "OTel exporter init failed (%s). Tracing will be no-op.", exc
+            "OTLP exporter package not installed. Tracing will be no-op."
         )
 
     trace.set_tracer_provider(provider)
@@ -76,6 +97,82 @@ def get_tracer(name: str = "cmop-observer") -> trace.Tracer:
     return trace.get_tracer(name)
 
 
+def is_tracing_enabled() -> bool:
+    """
+    Whether spans are actually being exported.
+
+    False until init_tracing() has run and wired a working exporter.
+    Callers use this to skip building expensive span attributes
+    (serialized payloads) that a no-op provider would discard.
+    """
+    return _initialized and _exporter_ok
+
+
+def _bound(
+    obj: Any, max_items: int = 50, max_str: int = 500, depth: int = 4
+) -> Any:
+    """
+    Recursively bound a payload before serialization.
+
+    Serializing a large response just to slice the string afterwards
+    allocates the full text first; trimming containers and strings up
+    front keeps tracing cost O(max_items × depth) regardless of how big
+    the tool response is. Elisions are marked in-band so the span still
+    shows how much was dropped.
+    """
+    if isinstance(obj, str):
+        if len(obj) > max_str:
+            return obj[:max_str] + f"… [+{len(obj) - max_str} chars]"
+        return obj
+    if isinstance(obj, dict):
+        if depth <= 0:
+            return f"… [dict with {len(obj)} keys]"
+        out = {
+            k: _bound(v, max_items, max_str, depth - 1)
+            for k, v in islice(obj.items(), max_items)
+        }
+        if len(obj) > max_items:
+            out["…"] = f"[+{len(obj) - max_items} more keys]"
+        return out
+    if isinstance(obj, (list, tuple)):
+        if depth <= 0:
+            return f"… [sequence of {len(obj)} items]"
+        out = [_bound(v, max_items, max_str, depth - 1) for v in obj[:max_items]]
+        if len(obj) > max_items:
+            out.append(f"… [+{len(obj) - max_items} more items]")
+        return out
+    return obj
+
+
+def truncate_json_with_len(
+    data: Any, max_chars: int = 4000
+) -> tuple[str, int]:
+    """
+    Serialize data to JSON once, returning (truncated text, full length).
+
+    Callers that need both the span-attribute string and the original
+    payload size (e.g. tool.response_chars) get them from a single
+    serialization instead of dumping the payload twice. The payload is
+    bounded with :func:`_bound` first, so the reported length reflects
+    the bounded view rather than the raw response.
+    """
+    data = _bound(data)
+    try:
+        if orjson is not None:
+            text = orjson.dumps(
+                data, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        else:
+            text = json.dumps(data, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        text = str(data)
+
+    total = len(text)
+    if total > max_chars:
+        return text[:max_chars] + f"... [truncated, total {total} chars]", total
+    return text, total
+
+
 def truncate_json(data: Any, max_chars: int = 4000) -> str:
     """
     Serialize data to JSON and truncate for span attributes.
@@ -84,14 +181,7 @@ def truncate_json(data: Any, max_chars: int = 4000) -> str:
     Truncation ensures we capture enough for debugging
     without blowing up the trace backend.
     """
-    try:
-        text = json.dumps(data, ensure_ascii=False, default=str)
-    except (TypeError, ValueError):
-        text = str(data)
-
-    if len(text) > max_chars:
-        return text[:max_chars] + f"... [truncated, total {len(text)} chars]"
-    return text
+    return truncate_json_with_len(data, max_chars)[0]
 
 
 def record_error(span: trace.Span, exc: Exception) -> None:
@@ -103,6 +193,8 @@ def record_error(span: trace.Span, exc: Exception) -> None:
 __all__ = [
     "get_tracer",
     "init_tracing",
+    "is_tracing_enabled",
     "record_error",
     "truncate_json",
+    "truncate_json_with_len",
 ]
\ No newline at end of file